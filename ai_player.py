@@ -3,23 +3,57 @@ AI Player using Minimax Algorithm with Alpha-Beta Pruning
 Uses heuristic evaluation and lookahead to make strategic decisions
 """
 
-import numpy as np
-from typing import Tuple, Optional
-from board import Board, PLAYER, AI
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Tuple, Optional
+from board import Board, PLAYER, AI, COLS
+
+# Transposition table bound flags
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# Maximum number of transposition table entries before it is cleared
+TT_MAX_ENTRIES = 2_000_000
+
+
+class TTEntry(NamedTuple):
+    """Search result cached for a position"""
+    depth: int
+    value: int
+    flag: int
+    best_move: int
 
 
 class AIPlayer:
     """AI player using Minimax with Alpha-Beta Pruning"""
 
-    def __init__(self, piece: int, depth: int = 5):
+    def __init__(self, piece: int, depth: int = 5, time_budget_s: Optional[float] = None,
+                 workers: int = 1):
         self.piece = piece
         self.depth = depth
+        # Stop deepening once a search iteration finishes past this many seconds
+        self.time_budget_s = time_budget_s
+        # Processes used to search root moves in parallel (1 keeps the search serial)
+        self.workers = workers
+        self.executor = None
         self.opponent = PLAYER if piece == AI else AI
+        # Center-out search order: central columns produce cutoffs sooner
+        self.column_order = [3, 2, 4, 1, 5, 0, 6]
+        # Last column that caused a cutoff at each remaining depth; cleared
+        # every deepening pass so a depth always maps to the same side to move
+        self.killers: Dict[int, int] = {}
+        # Per-column cutoff credit for each side (keyed by color), weighted by depth squared
+        self.history = {1: [0] * COLS, -1: [0] * COLS}
+        # Transposition table keyed by the smaller of Board.hash and its mirror,
+        # combined with the side to move
+        self.tt = {}
 
     def minimax(self, board: Board, depth: int, alpha: float, beta: float,
                 maximizing_player: bool) -> Tuple[Optional[int], int]:
         """
-        Minimax algorithm with alpha-beta pruning
+        Minimax algorithm with alpha-beta pruning, scored from the AI's side
 
         Args:
             board: Current game board
@@ -31,64 +65,116 @@ class AIPlayer:
         Returns:
             Tuple of (best_column, score)
         """
-        valid_locations = board.get_valid_locations()
-        is_terminal = board.is_terminal_node()
+        if maximizing_player:
+            return self.negamax(board, depth, alpha, beta, 1)
+        col, score = self.negamax(board, depth, -beta, -alpha, -1)
+        return col, -score
+
+    def negamax(self, board: Board, depth: int, alpha: float, beta: float,
+                color: int) -> Tuple[Optional[int], int]:
+        """
+        Negamax with alpha-beta pruning and principal variation search
+
+        Args:
+            board: Current game board
+            depth: Remaining depth to search
+            alpha: Best value already guaranteed to the side to move
+            beta: Best value already guaranteed to its opponent
+            color: 1 if the AI is to move, -1 if the opponent is
+
+        Returns:
+            Tuple of (best_column, score for the side to move)
+        """
+        is_terminal, winner = board.status()
 
         # Base cases
         if depth == 0 or is_terminal:
             if is_terminal:
-                if board.check_winner(self.piece):
-                    return (None, 100000)
-                elif board.check_winner(self.opponent):
-                    return (None, -100000)
+                if winner == self.piece:
+                    return (None, color * 100000)
+                elif winner == self.opponent:
+                    return (None, -color * 100000)
                 else:  # No more valid moves (draw)
                     return (None, 0)
             else:  # Depth is zero
-                return (None, board.score_position(self.piece))
-
-        if maximizing_player:
-            value = -np.inf
-            best_col = np.random.choice(valid_locations)
-
-            for col in valid_locations:
-                row = board.get_next_open_row(col)
-                temp_board = board.board.copy()
+                return (None, color * board.score_position(self.piece))
 
-                board.drop_piece(row, col, self.piece)
-                new_score = self.minimax(board, depth - 1, alpha, beta, False)[1]
-                board.board = temp_board
-
-                if new_score > value:
-                    value = new_score
-                    best_col = col
-
-                alpha = max(alpha, value)
+        # Reuse results for positions already reached by another move order.
+        # Mirror-image positions share an entry whose move is stored for
+        # whichever orientation has the smaller hash.
+        mirrored = board.mirror_hash < board.hash
+        key = board.mirror_hash if mirrored else board.hash
+        # Values are relative to the side to move, so it is part of the key
+        key = 2 * key + (color == -1)
+        entry = self.tt.get(key)
+        tt_move = None
+        if entry is not None:
+            tt_move = COLS - 1 - entry.best_move if mirrored else entry.best_move
+            if entry.depth >= depth:
+                if entry.flag == EXACT:
+                    return tt_move, entry.value
+                if entry.flag == LOWER:
+                    alpha = max(alpha, entry.value)
+                else:
+                    beta = min(beta, entry.value)
                 if alpha >= beta:
-                    break  # Beta cutoff
+                    return tt_move, entry.value
+        alpha_orig, beta_orig = alpha, beta
+
+        # Try the cached best move first, then the killer move, then the
+        # rest by history score (center-out among equal scores)
+        valid_locations = board.get_valid_locations()
+        ordered = sorted((c for c in self.column_order if c in valid_locations),
+                         key=self.history[color].__getitem__, reverse=True)
+        for move in (self.killers.get(depth), tt_move):
+            if move in ordered:
+                ordered.remove(move)
+                ordered.insert(0, move)
 
-            return best_col, value
+        piece = self.piece if color == 1 else self.opponent
+        value = -math.inf
+        best_col = ordered[0]
 
-        else:  # Minimizing player
-            value = np.inf
-            best_col = np.random.choice(valid_locations)
+        # Bound methods hoisted out of the loop
+        play, undo, negamax = board.play, board.undo, self.negamax
+        for col in ordered:
+            play(col, piece)
+            if col == ordered[0]:
+                new_score = -negamax(board, depth - 1, -beta, -alpha, -color)[1]
+            else:
+                # Null window: only prove the move is no better than the best so far
+                new_score = -negamax(board, depth - 1, -alpha - 1, -alpha, -color)[1]
+                if alpha < new_score < beta:
+                    new_score = -negamax(board, depth - 1, -beta, -new_score, -color)[1]
+            undo(col)
 
-            for col in valid_locations:
-                row = board.get_next_open_row(col)
-                temp_board = board.board.copy()
+            if new_score > value:
+                value = new_score
+                best_col = col
 
-                board.drop_piece(row, col, self.opponent)
-                new_score = self.minimax(board, depth - 1, alpha, beta, True)[1]
-                board.board = temp_board
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                self.killers[depth] = col
+                self.history[color][col] += depth * depth
+                break  # Cutoff
 
-                if new_score < value:
-                    value = new_score
-                    best_col = col
+        self.store(key, depth, value, alpha_orig, beta_orig,
+                   COLS - 1 - best_col if mirrored else best_col)
+        return best_col, value
 
-                beta = min(beta, value)
-                if alpha >= beta:
-                    break  # Alpha cutoff
+    def store(self, key: int, depth: int, value: int, alpha: float, beta: float,
+              best_col: int):
+        """Record a search result under a canonical transposition table key"""
+        if value <= alpha:
+            flag = UPPER
+        elif value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
 
-            return best_col, value
+        if len(self.tt) >= TT_MAX_ENTRIES:
+            self.tt.clear()
+        self.tt[key] = TTEntry(depth, value, flag, best_col)
 
     def get_move(self, board: Board) -> int:
         """
@@ -101,6 +187,89 @@ class AIPlayer:
             Column index for the best move
         """
         print(f"\nAI is thinking (searching {self.depth} moves ahead)...")
-        col, score = self.minimax(board, self.depth, -np.inf, np.inf, True)
+        valid_locations = board.get_valid_locations()
+        if (self.workers > 1 and self.time_budget_s is None and self.depth > 2
+                and len(valid_locations) > 1):
+            col = self.search_root_parallel(board, valid_locations)
+            print(f"AI placed piece in column {col}")
+            return col
+
+        start = time.perf_counter()
+
+        # Iterative deepening: each pass leaves its best moves in the
+        # transposition table, which orders the next, deeper pass
+        for depth in range(1, self.depth + 1):
+            self.killers.clear()
+            col, score = self.negamax(board, depth, -math.inf, math.inf, 1)
+            if self.time_budget_s is not None and time.perf_counter() - start >= self.time_budget_s:
+                break
+
         print(f"AI placed piece in column {col}")
         return col
+
+    def close(self):
+        """Shut down the worker processes used for parallel root search"""
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def search_root_parallel(self, board: Board, valid_locations: List[int]) -> int:
+        """
+        Search every root move in its own worker process
+
+        Root moves are searched independently (no shared alpha-beta bounds
+        or transposition table), so this only pays off with several cores
+        and deep searches. It is not used when a time budget is set.
+
+        Args:
+            board: Current game board
+            valid_locations: Columns the AI can play
+
+        Returns:
+            Column index for the best move
+        """
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        futures = [(col, self.executor.submit(search_root_move, board.bb[0], board.bb[1],
+                                              self.piece, col, self.depth - 1))
+                   for col in self.column_order if col in valid_locations]
+
+        best_col, best_score = futures[0][0], -math.inf
+        for col, future in futures:
+            score = future.result()
+            if score > best_score:
+                best_col, best_score = col, score
+        return best_col
+
+
+# AIPlayer per piece, kept for the lifetime of a worker process
+_worker_players: Dict[int, AIPlayer] = {}
+
+
+def search_root_move(bb0: int, bb1: int, piece: int, col: int, depth: int) -> int:
+    """
+    Score of playing a root move, for use in a worker process
+
+    Args:
+        bb0: Bitboard of PLAYER pieces
+        bb1: Bitboard of AI pieces
+        piece: Piece of the AI making the move
+        col: Column to play
+        depth: Remaining depth to search after the move
+
+    Returns:
+        Score of the move from the AI's point of view
+    """
+    board = Board.from_bitboards(bb0, bb1)
+    board.play(col, piece)
+    # Reuse this process's player so its tables carry over between turns
+    player = _worker_players.get(piece)
+    if player is None:
+        player = _worker_players[piece] = AIPlayer(piece, depth)
+
+    score = 0
+    for d in range(depth + 1):
+        player.killers.clear()
+        score = -player.negamax(board, d, -math.inf, math.inf, -1)[1]
+    return score
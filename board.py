@@ -4,7 +4,14 @@ Handles board state and game logic
 """
 
 import numpy as np
-from typing import List
+from typing import List, Optional, Tuple
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels then run as plain Python
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled"""
+        return lambda func: func
 
 # Game Constants
 ROWS = 6
@@ -14,128 +21,223 @@ PLAYER = 1
 AI = 2
 WINDOW_LENGTH = 4
 
+# Bitboard layout: every column takes ROWS + 1 bits (the extra bit is a
+# sentinel that keeps columns apart), so cell (row, col) is bit col * 7 + row.
+BITS_PER_COL = ROWS + 1
+BOTTOM_MASK = sum(1 << (c * BITS_PER_COL) for c in range(COLS))
+TOP_MASK = BOTTOM_MASK << (ROWS - 1)
+BOARD_MASK = BOTTOM_MASK * ((1 << ROWS) - 1)
+
+# Zobrist keys: one random 64-bit value per (player, bit index)
+ZOBRIST = [[int(key) for key in row] for row in
+           np.random.SeedSequence(0).generate_state(2 * COLS * BITS_PER_COL, dtype=np.uint64)
+           .reshape(2, COLS * BITS_PER_COL)]
+
+# Bit index of the left-right mirror image of every bit index
+MIRROR = [(COLS - 1 - bit // BITS_PER_COL) * BITS_PER_COL + bit % BITS_PER_COL
+          for bit in range(COLS * BITS_PER_COL)]
+
+CENTER_MASK = ((1 << ROWS) - 1) << ((COLS // 2) * BITS_PER_COL)
+
+
+def _window_masks() -> np.ndarray:
+    """Bitmask of every horizontal, vertical and diagonal window of 4 cells"""
+    masks = []
+    for dr, dc in ((0, 1), (1, 0), (1, 1), (-1, 1)):
+        for r in range(ROWS):
+            for c in range(COLS):
+                end_r = r + dr * (WINDOW_LENGTH - 1)
+                end_c = c + dc * (WINDOW_LENGTH - 1)
+                if 0 <= end_r < ROWS and end_c < COLS:
+                    masks.append(sum(1 << ((c + dc * i) * BITS_PER_COL + r + dr * i)
+                                     for i in range(WINDOW_LENGTH)))
+    # int64 rather than uint64 so Numba never mixes signedness (masks fit in 49 bits)
+    return np.array(masks, dtype=np.int64)
+
+
+# The 69 windows a four in a row can occupy
+WINDOWS = _window_masks()
+
+
+def _evaluate_counts(piece_count: int, opp_count: int) -> int:
+    """Score a window holding piece_count own and opp_count opponent pieces"""
+    score = 0
+    empty_count = WINDOW_LENGTH - piece_count - opp_count
+
+    # Strong positions
+    if piece_count == 4:
+        score += 100
+    elif piece_count == 3 and empty_count == 1:
+        score += 5
+    elif piece_count == 2 and empty_count == 2:
+        score += 2
+
+    # Block opponent
+    if opp_count == 3 and empty_count == 1:
+        score -= 4
+
+    return score
+
+
+def _score_table() -> np.ndarray:
+    """Tabulate _evaluate_counts for every possible window"""
+    table = np.zeros((WINDOW_LENGTH + 1, WINDOW_LENGTH + 1), dtype=np.int64)
+    for piece_count in range(WINDOW_LENGTH + 1):
+        for opp_count in range(WINDOW_LENGTH + 1 - piece_count):
+            table[piece_count][opp_count] = _evaluate_counts(piece_count, opp_count)
+    return table
+
+
+# Window score indexed by [own pieces][opponent pieces] in the window
+SCORE_TABLE = _score_table()
+
+
+@njit(cache=True)
+def popcount_nb(x: int) -> int:
+    """Count the set bits of a sparse bitboard"""
+    count = 0
+    while x:
+        x &= x - 1
+        count += 1
+    return count
+
+
+@njit(cache=True)
+def score_position_nb(bb0: int, bb1: int, piece: int) -> int:
+    """Heuristic evaluation of a position given as two bitboards"""
+    own = bb0 if piece == PLAYER else bb1
+    opp = bb1 if piece == PLAYER else bb0
+
+    # Center column preference (center control is strategic)
+    score = 3 * popcount_nb(own & CENTER_MASK)
+
+    for i in range(WINDOWS.shape[0]):
+        mask = WINDOWS[i]
+        score += SCORE_TABLE[popcount_nb(own & mask)][popcount_nb(opp & mask)]
+
+    return score
+
 
 class Board:
     """Connect 4 game board and logic"""
 
     def __init__(self):
-        self.board = np.zeros((ROWS, COLS), dtype=int)
+        # One bitboard per player (index piece - 1)
+        self.bb = [0, 0]
+        # Bit index of the next free cell in each column
+        self.heights = [c * BITS_PER_COL for c in range(COLS)]
+        # Zobrist hash of the position, updated on every move
+        self.hash = 0
+        # Zobrist hash of the left-right mirrored position
+        self.mirror_hash = 0
+
+    @classmethod
+    def from_bitboards(cls, bb0: int, bb1: int) -> "Board":
+        """Rebuild a board from the PLAYER and AI bitboards"""
+        board = cls()
+        for col in range(COLS):
+            for row in range(ROWS):
+                bit = 1 << (col * BITS_PER_COL + row)
+                if bb0 & bit:
+                    board.play(col, PLAYER)
+                elif bb1 & bit:
+                    board.play(col, AI)
+                else:
+                    break
+        return board
 
     def is_valid_location(self, col: int) -> bool:
         """Check if a column has space for a piece"""
-        return self.board[ROWS - 1][col] == EMPTY
+        return self.heights[col] - BITS_PER_COL * col < ROWS
 
     def get_next_open_row(self, col: int) -> int:
         """Find the next available row in a column"""
-        for r in range(ROWS):
-            if self.board[r][col] == EMPTY:
-                return r
-        return -1
+        row = self.heights[col] - BITS_PER_COL * col
+        return row if row < ROWS else -1
 
     def drop_piece(self, row: int, col: int, piece: int):
-        """Place a piece on the board"""
-        self.board[row][col] = piece
+        """Place a piece on the board (the row is implied by the column height)"""
+        self.play(col, piece)
+
+    def play(self, col: int, piece: int):
+        """Place a piece on top of a column"""
+        bit = self.heights[col]
+        index = piece - 1
+        self.bb[index] ^= 1 << bit
+        self.hash ^= ZOBRIST[index][bit]
+        self.mirror_hash ^= ZOBRIST[index][MIRROR[bit]]
+        self.heights[col] = bit + 1
+
+    def undo(self, col: int):
+        """Remove the top piece from a column"""
+        bit = self.heights[col] - 1
+        self.heights[col] = bit
+        mask = 1 << bit
+        index = 0 if self.bb[0] & mask else 1
+        self.bb[index] ^= mask
+        self.hash ^= ZOBRIST[index][bit]
+        self.mirror_hash ^= ZOBRIST[index][MIRROR[bit]]
 
     def get_valid_locations(self) -> List[int]:
         """Get all columns that are not full"""
-        return [col for col in range(COLS) if self.is_valid_location(col)]
+        free = (~(self.bb[0] | self.bb[1]) & TOP_MASK) >> (ROWS - 1)
+        cols = []
+        while free:
+            cols.append(((free & -free).bit_length() - 1) // BITS_PER_COL)
+            free &= free - 1
+        return cols
+
+    def to_array(self) -> np.ndarray:
+        """Decode the bitboards into a (ROWS, COLS) grid of pieces"""
+        grid = np.zeros((ROWS, COLS), dtype=np.uint8)
+        for piece in (PLAYER, AI):
+            bb = self.bb[piece - 1]
+            for c in range(COLS):
+                for r in range(ROWS):
+                    if bb >> (c * BITS_PER_COL + r) & 1:
+                        grid[r, c] = piece
+        return grid
 
     def check_winner(self, piece: int) -> bool:
         """Check if a player has won"""
-        # Horizontal check
-        for r in range(ROWS):
-            for c in range(COLS - 3):
-                if all(self.board[r][c + i] == piece for i in range(4)):
-                    return True
-
-        # Vertical check
-        for c in range(COLS):
-            for r in range(ROWS - 3):
-                if all(self.board[r + i][c] == piece for i in range(4)):
-                    return True
-
-        # Positive diagonal check
-        for r in range(ROWS - 3):
-            for c in range(COLS - 3):
-                if all(self.board[r + i][c + i] == piece for i in range(4)):
-                    return True
-
-        # Negative diagonal check
-        for r in range(3, ROWS):
-            for c in range(COLS - 3):
-                if all(self.board[r - i][c + i] == piece for i in range(4)):
-                    return True
-
-        return False
+        bb = self.bb[piece - 1]
+        # Pairs of adjacent pieces in each direction, then pairs of pairs
+        h = bb & (bb >> BITS_PER_COL)
+        d1 = bb & (bb >> (BITS_PER_COL - 1))
+        d2 = bb & (bb >> (BITS_PER_COL + 1))
+        v = bb & (bb >> 1)
+        return ((h & (h >> 2 * BITS_PER_COL))
+                | (d1 & (d1 >> 2 * (BITS_PER_COL - 1)))
+                | (d2 & (d2 >> 2 * (BITS_PER_COL + 1)))
+                | (v & (v >> 2))) != 0
+
+    def status(self) -> Tuple[bool, Optional[int]]:
+        """Check if game is over, returning (is_terminal, winning piece or None)"""
+        if self.check_winner(PLAYER):
+            return True, PLAYER
+        if self.check_winner(AI):
+            return True, AI
+        return (self.bb[0] | self.bb[1]) == BOARD_MASK, None
 
     def is_terminal_node(self) -> bool:
         """Check if game is over"""
-        return self.check_winner(PLAYER) or self.check_winner(AI) or len(self.get_valid_locations()) == 0
+        return self.status()[0]
 
     def evaluate_window(self, window: np.ndarray, piece: int) -> int:
         """Evaluate a window of 4 positions for scoring"""
-        score = 0
         opp_piece = PLAYER if piece == AI else AI
-
         piece_count = np.count_nonzero(window == piece)
-        empty_count = np.count_nonzero(window == EMPTY)
         opp_count = np.count_nonzero(window == opp_piece)
-
-        # Strong positions
-        if piece_count == 4:
-            score += 100
-        elif piece_count == 3 and empty_count == 1:
-            score += 5
-        elif piece_count == 2 and empty_count == 2:
-            score += 2
-
-        # Block opponent
-        if opp_count == 3 and empty_count == 1:
-            score -= 4
-
-        return score
+        return int(SCORE_TABLE[piece_count][opp_count])
 
     def score_position(self, piece: int) -> int:
         """Heuristic evaluation of board position"""
-        score = 0
-
-        # Center column preference (center control is strategic)
-        center_array = [int(i) for i in list(self.board[:, COLS // 2])]
-        center_count = center_array.count(piece)
-        score += center_count * 3
-
-        # Horizontal scoring
-        for r in range(ROWS):
-            row_array = [int(i) for i in list(self.board[r, :])]
-            for c in range(COLS - 3):
-                window = row_array[c:c + WINDOW_LENGTH]
-                score += self.evaluate_window(np.array(window), piece)
-
-        # Vertical scoring
-        for c in range(COLS):
-            col_array = [int(i) for i in list(self.board[:, c])]
-            for r in range(ROWS - 3):
-                window = col_array[r:r + WINDOW_LENGTH]
-                score += self.evaluate_window(np.array(window), piece)
-
-        # Positive diagonal scoring
-        for r in range(ROWS - 3):
-            for c in range(COLS - 3):
-                window = [self.board[r + i][c + i] for i in range(WINDOW_LENGTH)]
-                score += self.evaluate_window(np.array(window), piece)
-
-        # Negative diagonal scoring
-        for r in range(ROWS - 3):
-            for c in range(COLS - 3):
-                window = [self.board[r + 3 - i][c + i] for i in range(WINDOW_LENGTH)]
-                score += self.evaluate_window(np.array(window), piece)
-
-        return score
+        return int(score_position_nb(self.bb[0], self.bb[1], piece))
 
     def print_board(self):
         """Display the board"""
         print("\n" + "=" * 29)
-        print(np.flip(self.board, 0))
+        print(self.to_array()[::-1])
         print("=" * 29)
         print(" 0  1  2  3  4  5  6")
         print()
@@ -143,5 +245,8 @@ class Board:
     def copy(self):
         """Create a deep copy of the board"""
         new_board = Board()
-        new_board.board = self.board.copy()
+        new_board.bb = self.bb[:]
+        new_board.heights = self.heights[:]
+        new_board.hash = self.hash
+        new_board.mirror_hash = self.mirror_hash
         return new_board
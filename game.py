@@ -75,4 +75,5 @@ class Game:
         while not self.game_over:
             self.play_turn()
 
+        self.player2.close()
         print("\nThanks for playing!")
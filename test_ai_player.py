@@ -0,0 +1,36 @@
+"""
+Tests for the AI player
+Run with: python -m unittest test_ai_player
+"""
+
+import math
+import random
+import unittest
+
+from board import Board, PLAYER, AI
+from ai_player import AIPlayer
+
+
+class TranspositionTableTest(unittest.TestCase):
+    """Cached results must not leak between the two sides to move"""
+
+    def test_shared_table_matches_fresh_search(self):
+        rng = random.Random(0)
+        for _ in range(50):
+            board = Board()
+            piece = PLAYER
+            for _ in range(6):
+                board.play(rng.choice(board.get_valid_locations()), piece)
+                piece = AI if piece == PLAYER else PLAYER
+            if board.is_terminal_node():
+                continue
+
+            player = AIPlayer(AI, 2)
+            player.minimax(board, 2, -math.inf, math.inf, True)
+            shared = player.minimax(board, 2, -math.inf, math.inf, False)[1]
+            fresh = AIPlayer(AI, 2).minimax(board, 2, -math.inf, math.inf, False)[1]
+            self.assertEqual(shared, fresh)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+"""
+Tests for the Connect 4 board
+Run with: python -m unittest test_board
+"""
+
+import os
+import random
+import subprocess
+import sys
+import unittest
+
+from board import Board, PLAYER, AI, ROWS, COLS, WINDOWS, SCORE_TABLE
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def popcount(x: int) -> int:
+    """Count set bits of a Python int"""
+    return bin(x).count("1")
+
+
+def rescan_score(board: Board, piece: int) -> int:
+    """Score a position from scratch: every window plus the center bonus"""
+    own = board.bb[piece - 1]
+    opp = board.bb[2 - piece]
+    score = 3 * int((board.to_array()[:, COLS // 2] == piece).sum())
+    for mask in WINDOWS:
+        mask = int(mask)
+        score += int(SCORE_TABLE[popcount(own & mask)][popcount(opp & mask)])
+    return score
+
+
+def board_from_rows(rows) -> Board:
+    """Build a board from strings drawn top row first ('.' empty, '1'/'2' pieces)"""
+    board = Board()
+    for col in range(COLS):
+        for line in reversed(rows):
+            if line[col] != ".":
+                board.play(col, int(line[col]))
+    return board
+
+
+class RulesTest(unittest.TestCase):
+    """Game rules on the bitboard representation"""
+
+    def assert_only_winner(self, board: Board, piece: int):
+        self.assertTrue(board.check_winner(piece))
+        self.assertFalse(board.check_winner(AI if piece == PLAYER else PLAYER))
+        self.assertEqual(board.status(), (True, piece))
+
+    def test_horizontal_win(self):
+        self.assert_only_winner(board_from_rows([
+            ".......",
+            ".......",
+            ".......",
+            ".......",
+            "...222.",
+            "..1111.",
+        ]), PLAYER)
+
+    def test_vertical_win(self):
+        self.assert_only_winner(board_from_rows([
+            ".......",
+            ".......",
+            "......2",
+            "......2",
+            "1....12",
+            "1...112",
+        ]), AI)
+
+    def test_positive_diagonal_win(self):
+        self.assert_only_winner(board_from_rows([
+            ".......",
+            ".......",
+            "...1...",
+            "..12...",
+            ".122...",
+            "1221...",
+        ]), PLAYER)
+
+    def test_negative_diagonal_win(self):
+        self.assert_only_winner(board_from_rows([
+            ".......",
+            ".......",
+            "...2...",
+            "...12..",
+            "...112.",
+            "...1212",
+        ]), AI)
+
+    def test_run_across_column_padding_is_not_a_win(self):
+        # Top three cells of column 0 and the bottom of column 1 are
+        # adjacent bits only if the padding bit between columns is ignored
+        board = board_from_rows([
+            "1......",
+            "1......",
+            "1......",
+            "2......",
+            "2......",
+            "21.....",
+        ])
+        self.assertFalse(board.check_winner(PLAYER))
+        self.assertFalse(board.check_winner(AI))
+        self.assertEqual(board.status(), (False, None))
+
+    def test_full_column(self):
+        board = Board()
+        for row in range(ROWS):
+            self.assertEqual(board.get_next_open_row(3), row)
+            board.play(3, PLAYER if row % 4 < 2 else AI)
+        self.assertFalse(board.is_valid_location(3))
+        self.assertEqual(board.get_next_open_row(3), -1)
+        self.assertEqual(board.get_valid_locations(), [0, 1, 2, 4, 5, 6])
+
+    def test_full_board_without_winner_is_a_draw(self):
+        board = board_from_rows([
+            "1212121",
+            "1212121",
+            "2121212",
+            "2121212",
+            "1212121",
+            "1212121",
+        ])
+        self.assertEqual(board.get_valid_locations(), [])
+        self.assertEqual(board.status(), (True, None))
+
+
+class ScoreTest(unittest.TestCase):
+    """score_position must match a full rescan after any play or undo"""
+
+    def assert_scores(self, board: Board):
+        for piece in (PLAYER, AI):
+            self.assertEqual(board.score_position(piece), rescan_score(board, piece))
+
+    def test_random_play_and_undo(self):
+        rng = random.Random(0)
+        for _ in range(20):
+            board = Board()
+            played = []
+            piece = PLAYER
+            while board.get_valid_locations() and not board.is_terminal_node():
+                if played and rng.random() < 0.3:
+                    board.undo(played.pop())
+                    piece = AI if piece == PLAYER else PLAYER
+                else:
+                    col = rng.choice(board.get_valid_locations())
+                    board.play(col, piece)
+                    played.append(col)
+                    piece = AI if piece == PLAYER else PLAYER
+                self.assert_scores(board)
+
+            while played:
+                board.undo(played.pop())
+                self.assert_scores(board)
+            self.assertEqual(board.bb, [0, 0])
+
+
+# Runs ScoreTest with numba made unimportable, so the kernels run as plain Python
+NO_NUMBA_SCRIPT = """
+import sys
+import unittest
+sys.modules["numba"] = None
+unittest.main(module="test_board", argv=["test_board", "ScoreTest"])
+"""
+
+
+class BoardWithoutNumbaTest(unittest.TestCase):
+    """Board must keep working when the optional numba dependency is missing"""
+
+    def test_score_without_numba(self):
+        result = subprocess.run([sys.executable, "-c", NO_NUMBA_SCRIPT], cwd=HERE,
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()